@@ -1,9 +1,54 @@
+import argparse
+import io
+import os
 import platform
 import psutil
+import re
+import socket
 import subprocess
 import sys
 import json
-from datetime import datetime
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Window between priming cpu_percent and the first real reading in main()
+CPU_SAMPLE_WINDOW = 0.2
+
+# Usage percentages above which check_system_health warns
+CPU_WARN_PERCENT = 80.0
+MEMORY_WARN_PERCENT = 85.0
+DISK_WARN_PERCENT = 90.0
+
+# Boot time never changes while we run
+_BOOT_TIME = psutil.boot_time()
+
+# Optional psutil/os APIs, None on platforms that don't provide them
+_LOADAVG = getattr(psutil, 'getloadavg', None)
+_SENSORS_TEMPERATURES = getattr(psutil, 'sensors_temperatures', None)
+_STATVFS = getattr(os, 'statvfs', None)
+
+_GB_RECIP = 1.0 / (1024**3)
+
+# Bound format method for "12.3%" style fields
+_percent = "{:.1f}%".format
+
+def _gb(n):
+    """Format a byte count as gigabytes"""
+    return f"{n * _GB_RECIP:.2f} GB"
+
+# Prime the counter so later non-blocking reads return a real delta
+psutil.cpu_percent(interval=None)
 
 def get_system_info():
     """Get basic system information"""
@@ -19,95 +64,416 @@ def get_system_info():
     }
     return info
 
+@lru_cache(maxsize=None)
+def _cpu_count(logical):
+    """Core counts never change after boot, so only ask psutil once"""
+    return psutil.cpu_count(logical=logical)
+
+def read_cpu():
+    """Get raw CPU readings, frequencies in MHz and None where unavailable"""
+    # cpu_freq() reads every core's cpufreq file, so call it only once
+    freq = psutil.cpu_freq()
+    return {
+        'physical_cores': _cpu_count(False),
+        'total_cores': _cpu_count(True),
+        'max_freq': freq.max if freq else None,
+        'current_freq': freq.current if freq else None,
+        # Non-blocking: usage since the previous call, primed at import
+        'cpu_percent': psutil.cpu_percent(interval=None),
+        'load_avg': _LOADAVG()[0] if _LOADAVG else None
+    }
+
+def format_cpu(cpu):
+    """Format read_cpu() readings for display"""
+    return {
+        'Physical Cores': cpu['physical_cores'],
+        'Total Cores': cpu['total_cores'],
+        'Max Frequency': f"{cpu['max_freq']:.2f} MHz" if cpu['max_freq'] is not None else "N/A",
+        'Current Frequency': f"{cpu['current_freq']:.2f} MHz" if cpu['current_freq'] is not None else "N/A",
+        'CPU Usage': _percent(cpu['cpu_percent']),
+        'Load Average (1min)': cpu['load_avg'] if cpu['load_avg'] is not None else "N/A"
+    }
+
 def get_cpu_info():
     """Get CPU information and status"""
-    cpu_info = {
-        'Physical Cores': psutil.cpu_count(logical=False),
-        'Total Cores': psutil.cpu_count(logical=True),
-        'Max Frequency': f"{psutil.cpu_freq().max:.2f} MHz" if psutil.cpu_freq() else "N/A",
-        'Current Frequency': f"{psutil.cpu_freq().current:.2f} MHz" if psutil.cpu_freq() else "N/A",
-        'CPU Usage': f"{psutil.cpu_percent(interval=1):.1f}%",
-        'Load Average (1min)': psutil.getloadavg()[0] if hasattr(psutil, 'getloadavg') else "N/A"
+    return format_cpu(read_cpu())
+
+def read_memory():
+    """Get raw memory readings in bytes and percent"""
+    memory = psutil.virtual_memory()
+    swap = psutil.swap_memory()
+    return {
+        'ram_total': memory.total,
+        'ram_available': memory.available,
+        'ram_percent': memory.percent,
+        'swap_total': swap.total,
+        'swap_percent': swap.percent
+    }
+
+def format_memory(memory):
+    """Format read_memory() readings for display"""
+    return {
+        'Total RAM': _gb(memory['ram_total']),
+        'Available RAM': _gb(memory['ram_available']),
+        'RAM Usage': _percent(memory['ram_percent']),
+        'Total Swap': _gb(memory['swap_total']),
+        'Swap Usage': _percent(memory['swap_percent'])
     }
-    return cpu_info
 
 def get_memory_info():
     """Get memory information"""
-    memory = psutil.virtual_memory()
-    swap = psutil.swap_memory()
+    return format_memory(read_memory())
+
+HWMON_ROOT = '/sys/class/hwmon'
+
+# (name, label, high, critical, fd) per hwmon temperature input, filled on first use
+_hwmon_sensors = None
+
+def _read_sysfs(path):
+    """Read a small sysfs attribute, or None if it is missing"""
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _read_millidegrees(path):
+    """Read a hwmon temperature attribute in °C, or None if it is missing"""
+    value = _read_sysfs(path)
+    try:
+        return int(value) / 1000 if value else None
+    except ValueError:
+        return None
+
+def _discover_hwmon_sensors():
+    """Enumerate hwmon temperature inputs once, the sensor layout is fixed per boot
+    
+    Labels and limits never change, so they are read here; the input files are
+    kept open so each sample is a single pread per sensor.
+    """
+    sensors = []
+    try:
+        hwmon_dirs = sorted(os.scandir(HWMON_ROOT), key=lambda entry: entry.name)
+    except OSError:
+        return sensors
+    
+    for hwmon in hwmon_dirs:
+        name = _read_sysfs(os.path.join(hwmon.path, 'name')) or hwmon.name
+        try:
+            inputs = sorted(entry.name for entry in os.scandir(hwmon.path)
+                            if entry.name.startswith('temp') and entry.name.endswith('_input'))
+        except OSError:
+            continue
+        
+        for input_name in inputs:
+            base = os.path.join(hwmon.path, input_name[:-len('_input')])
+            try:
+                fd = os.open(base + '_input', os.O_RDONLY)
+            except OSError:
+                continue
+            sensors.append((
+                name,
+                _read_sysfs(base + '_label'),
+                _read_millidegrees(base + '_max'),
+                _read_millidegrees(base + '_crit'),
+                fd
+            ))
+    return sensors
+
+def _read_temperatures():
+    """Get {sensor name: [(label, current, high, critical), ...]} in °C
+    
+    Returns None when the platform has no way to read temperatures.
+    """
+    global _hwmon_sensors
     
-    memory_info = {
-        'Total RAM': f"{memory.total / (1024**3):.2f} GB",
-        'Available RAM': f"{memory.available / (1024**3):.2f} GB",
-        'RAM Usage': f"{memory.percent:.1f}%",
-        'Total Swap': f"{swap.total / (1024**3):.2f} GB",
-        'Swap Usage': f"{swap.percent:.1f}%"
+    if platform.system() == "Linux":
+        if _hwmon_sensors is None:
+            _hwmon_sensors = _discover_hwmon_sensors()
+        if _hwmon_sensors:
+            temps = {}
+            for name, label, high, critical, fd in _hwmon_sensors:
+                try:
+                    current = int(os.pread(fd, 32, 0)) / 1000
+                except (OSError, ValueError):
+                    continue
+                temps.setdefault(name, []).append((label, current, high, critical))
+            return temps
+    
+    if _SENSORS_TEMPERATURES is None:
+        return None
+    return {
+        name: [(entry.label, entry.current, entry.high, entry.critical) for entry in entries]
+        for name, entries in _SENSORS_TEMPERATURES().items()
     }
-    return memory_info
+
+def read_temperatures():
+    """Get raw temperature readings, or None if monitoring isn't available"""
+    try:
+        return _read_temperatures()
+    except OSError:
+        return None
+
+def format_temperatures(temps):
+    """Format read_temperatures() readings for display"""
+    if temps is None:
+        return {"Status": "Temperature monitoring not available"}
+    
+    temp_info = {}
+    for name, entries in temps.items():
+        temp_info[name] = []
+        for label, current, high, critical in entries:
+            temp_data = {
+                'label': label or 'N/A',
+                'current': f"{current:.1f}°C",
+                'high': f"{high:.1f}°C" if high else "N/A",
+                'critical': f"{critical:.1f}°C" if critical else "N/A"
+            }
+            temp_info[name].append(temp_data)
+    
+    return temp_info if temp_info else {"Status": "No temperature sensors detected"}
 
 def get_temperature_info():
     """Get temperature sensors if available"""
+    return format_temperatures(read_temperatures())
+
+# Pseudo filesystems that can't meaningfully run out of space
+_SKIP_FS = frozenset({'squashfs', 'tmpfs', 'devtmpfs', 'overlay', 'autofs', 'proc', 'sysfs'})
+
+def _real_filesystems():
+    """Get the block-device filesystem types the kernel knows about
+    
+    Like psutil, anything in /proc/filesystems not marked nodev counts, plus
+    zfs which is listed as nodev.
+    """
     try:
-        temps = psutil.sensors_temperatures()
-        temp_info = {}
-        
-        for name, entries in temps.items():
-            temp_info[name] = []
-            for entry in entries:
-                temp_data = {
-                    'label': entry.label or 'N/A',
-                    'current': f"{entry.current:.1f}°C",
-                    'high': f"{entry.high:.1f}°C" if entry.high else "N/A",
-                    'critical': f"{entry.critical:.1f}°C" if entry.critical else "N/A"
-                }
-                temp_info[name].append(temp_data)
-        
-        return temp_info if temp_info else {"Status": "No temperature sensors detected"}
-    except:
-        return {"Status": "Temperature monitoring not available"}
+        with open('/proc/filesystems', 'rb') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return frozenset()
+    return frozenset(line.strip() for line in lines if not line.startswith(b'nodev')) | {b'zfs'}
 
-def get_disk_info():
-    """Get disk information"""
-    disk_info = {}
-    partitions = psutil.disk_partitions()
+# Filesystems worth reporting when reading /proc/self/mountinfo directly
+_REAL_FS = _real_filesystems() if platform.system() == "Linux" else frozenset()
+
+_MOUNT_ESCAPE = re.compile(rb'\\([0-7]{3})')
+
+def _linux_partitions():
+    """Get (device, mountpoint, fstype) for real filesystems from mountinfo
+    
+    One read of /proc/self/mountinfo, skipping psutil's per-line tuples.
+    """
+    with open('/proc/self/mountinfo', 'rb') as f:
+        data = f.read()
+    
+    partitions = []
+    for line in data.splitlines():
+        # Optional fields vary in number, the " - " separator marks their end
+        head, _, tail = line.partition(b' - ')
+        tail = tail.split(b' ', 2)
+        if len(tail) < 2 or tail[0] not in _REAL_FS:
+            continue
+        mountpoint = _MOUNT_ESCAPE.sub(lambda m: bytes([int(m.group(1), 8)]), head.split(b' ')[4])
+        partitions.append((os.fsdecode(tail[1]), os.fsdecode(mountpoint), tail[0].decode()))
+    return partitions
+
+def _disk_usage(mountpoint):
+    """Get (total, used, free, percent) for a mountpoint, computed like psutil"""
+    if _STATVFS is None:
+        usage = psutil.disk_usage(mountpoint)
+        return usage.total, usage.used, usage.free, usage.percent
     
-    for partition in partitions:
+    st = _STATVFS(mountpoint)
+    total = st.f_blocks * st.f_frsize
+    used = total - st.f_bfree * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    # Like df, the percentage ignores blocks reserved for root
+    total_user = used + free
+    percent = round(used / total_user * 100, 1) if total_user else 0.0
+    return total, used, free, percent
+
+def scan_disks():
+    """Walk disk partitions once and get raw usage per device
+    
+    Sizes are in bytes; a device whose usage can't be read maps to None.
+    """
+    disks = {}
+    if platform.system() == "Linux":
+        partitions = _linux_partitions()
+    else:
+        partitions = [(partition.device, partition.mountpoint, partition.fstype)
+                      for partition in psutil.disk_partitions(all=False)]
+    
+    for device, mountpoint, fstype in partitions:
+        if fstype in _SKIP_FS:
+            continue
         try:
-            partition_usage = psutil.disk_usage(partition.mountpoint)
-            disk_info[partition.device] = {
-                'Mountpoint': partition.mountpoint,
-                'File System': partition.fstype,
-                'Total Size': f"{partition_usage.total / (1024**3):.2f} GB",
-                'Used': f"{partition_usage.used / (1024**3):.2f} GB",
-                'Free': f"{partition_usage.free / (1024**3):.2f} GB",
-                'Usage %': f"{(partition_usage.used / partition_usage.total) * 100:.1f}%"
-            }
+            total, used, free, percent = _disk_usage(mountpoint)
         except PermissionError:
-            disk_info[partition.device] = {"Status": "Permission denied"}
+            disks[device] = None
+            continue
+        disks[device] = {
+            'mountpoint': mountpoint,
+            'fstype': fstype,
+            'total': total,
+            'used': used,
+            'free': free,
+            'percent': percent
+        }
     
+    return disks
+
+def format_disks(disks):
+    """Format scan_disks() readings for display"""
+    disk_info = {}
+    for device, usage in disks.items():
+        if usage is None:
+            disk_info[device] = {"Status": "Permission denied"}
+            continue
+        disk_info[device] = {
+            'Mountpoint': usage['mountpoint'],
+            'File System': usage['fstype'],
+            'Total Size': _gb(usage['total']),
+            'Used': _gb(usage['used']),
+            'Free': _gb(usage['free']),
+            'Usage %': _percent(usage['percent'])
+        }
     return disk_info
 
+def get_disk_info():
+    """Get disk information"""
+    return format_disks(scan_disks())
+
+# Display names for the address families psutil reports
+_FAMILY = {
+    int(socket.AF_INET): 'IPv4',
+    int(socket.AF_INET6): 'IPv6',
+    int(psutil.AF_LINK): 'MAC'
+}
+
 def get_network_info():
     """Get network interface information"""
-    network_info = {}
-    interfaces = psutil.net_if_addrs()
     stats = psutil.net_if_stats()
-    
-    for interface_name, interface_addresses in interfaces.items():
-        network_info[interface_name] = {
-            'addresses': [],
-            'is_up': stats[interface_name].isup if interface_name in stats else False,
-            'speed': f"{stats[interface_name].speed} Mbps" if interface_name in stats and stats[interface_name].speed > 0 else "N/A"
-        }
-        
-        for address in interface_addresses:
-            network_info[interface_name]['addresses'].append({
-                'family': str(address.family),
+    return {
+        interface_name: {
+            'addresses': [{
+                'family': int(address.family),
                 'address': address.address,
                 'netmask': address.netmask
-            })
+            } for address in interface_addresses],
+            'is_up': stat.isup if stat else False,
+            'speed': stat.speed if stat and stat.speed > 0 else None
+        }
+        for interface_name, interface_addresses in psutil.net_if_addrs().items()
+        for stat in (stats.get(interface_name),)
+    }
+
+# DMI fields exposed under /sys/class/dmi/id on Linux
+DMI_FIELDS = (
+    ('BIOS Version', '/sys/class/dmi/id/bios_version'),
+    ('Board Name', '/sys/class/dmi/id/board_name'),
+    ('Board Vendor', '/sys/class/dmi/id/board_vendor'),
+)
+
+# Registry values under HKLM\HARDWARE\DESCRIPTION\System\BIOS on Windows
+BIOS_REGISTRY_KEY = r"HARDWARE\DESCRIPTION\System\BIOS"
+BIOS_REGISTRY_FIELDS = (
+    ('BIOS Vendor', 'BIOSVendor'),
+    ('BIOS Version', 'BIOSVersion'),
+    ('BIOS Release Date', 'BIOSReleaseDate'),
+    ('System Manufacturer', 'SystemManufacturer'),
+    ('Board Name', 'BaseBoardProduct'),
+    ('Board Vendor', 'BaseBoardManufacturer'),
+)
+
+@lru_cache(maxsize=None)
+def _read_dmi(path):
+    """Read a DMI file once; its contents are fixed after boot"""
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except (FileNotFoundError, PermissionError):
+        return None
+
+@lru_cache(maxsize=1)
+def _read_bios_registry():
+    """Read BIOS values from the Windows registry once, without spawning a process"""
+    import winreg
+    
+    values = {}
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, BIOS_REGISTRY_KEY) as key:
+            for name, value_name in BIOS_REGISTRY_FIELDS:
+                try:
+                    value, _ = winreg.QueryValueEx(key, value_name)
+                except OSError:
+                    continue
+                if str(value).strip():
+                    values[name] = str(value).strip()
+    except OSError:
+        pass
+    return values
+
+# SMBIOS System Information (type 1) structure, serial number string index
+SMBIOS_SYSTEM_TYPE = 1
+SMBIOS_SERIAL_OFFSET = 0x07
+
+def _smbios_string(table, struct_type, field_offset):
+    """Get a string field from the first SMBIOS structure of struct_type
+    
+    table is the raw structure table; the field holds a 1-based index into
+    the strings that follow the structure's formatted area.
+    """
+    offset = 0
+    while offset + 4 <= len(table):
+        kind, length = table[offset], table[offset + 1]
+        strings_start = offset + length
+        # The string set ends with two NULs, also when it is empty
+        strings_end = table.find(b'\0\0', strings_start)
+        if length < 4 or strings_end < 0:
+            return None
+        if kind == struct_type:
+            if field_offset >= length:
+                return None
+            index = table[offset + field_offset]
+            strings = table[strings_start:strings_end].split(b'\0')
+            if 0 < index <= len(strings):
+                return strings[index - 1].decode('ascii', 'replace').strip() or None
+            return None
+        if kind == 127:  # End-of-table
+            return None
+        offset = strings_end + 2
+    return None
+
+@lru_cache(maxsize=1)
+def _read_smbios_serial():
+    """Read the system serial number from the raw SMBIOS table on Windows
+    
+    This is what wmic reported as the BIOS SerialNumber; the registry
+    doesn't have it.
+    """
+    import ctypes
+    
+    get_table = ctypes.windll.kernel32.GetSystemFirmwareTable
+    signature = int.from_bytes(b'RSMB', 'big')
+    size = get_table(signature, 0, None, 0)
+    if not size:
+        return None
+    buffer = ctypes.create_string_buffer(size)
+    if get_table(signature, 0, buffer, size) != size:
+        return None
     
-    return network_info
+    # RawSMBIOSData: four version bytes and a DWORD length before the table
+    data = buffer.raw
+    length = int.from_bytes(data[4:8], 'little')
+    return _smbios_string(data[8:8 + length], SMBIOS_SYSTEM_TYPE, SMBIOS_SERIAL_OFFSET)
+
+@lru_cache(maxsize=1)
+def _wmic_bios_output():
+    """Run wmic once and keep its output, spawning it is slow"""
+    result = subprocess.run(['wmic', 'bios', 'get', 'name,serialnumber,version', '/format:list'], 
+                          capture_output=True, text=True, timeout=10)
+    return result.stdout if result.returncode == 0 else None
 
 def get_bios_info():
     """Get BIOS/UEFI information (Windows/Linux)"""
@@ -115,11 +481,14 @@ def get_bios_info():
     
     try:
         if platform.system() == "Windows":
-            # Try to get BIOS info using wmic
-            result = subprocess.run(['wmic', 'bios', 'get', 'name,serialnumber,version', '/format:list'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
+            # Prefer the registry and SMBIOS table; fall back to wmic if they have nothing
+            bios_info.update(_read_bios_registry())
+            serial = _read_smbios_serial()
+            if serial:
+                bios_info['Serial Number'] = serial
+            output = None if bios_info else _wmic_bios_output()
+            if output is not None:
+                for line in output.split('\n'):
                     if '=' in line and line.strip():
                         key, value = line.split('=', 1)
                         if value.strip():
@@ -127,148 +496,321 @@ def get_bios_info():
         
         elif platform.system() == "Linux":
             # Try to read DMI information
-            try:
-                with open('/sys/class/dmi/id/bios_version', 'r') as f:
-                    bios_info['BIOS Version'] = f.read().strip()
-            except:
-                pass
-            
-            try:
-                with open('/sys/class/dmi/id/board_name', 'r') as f:
-                    bios_info['Board Name'] = f.read().strip()
-            except:
-                pass
-                
-            try:
-                with open('/sys/class/dmi/id/board_vendor', 'r') as f:
-                    bios_info['Board Vendor'] = f.read().strip()
-            except:
-                pass
+            for key, path in DMI_FIELDS:
+                value = _read_dmi(path)
+                if value is not None:
+                    bios_info[key] = value
     
     except Exception as e:
         bios_info['Error'] = f"Could not retrieve BIOS info: {str(e)}"
     
     return bios_info if bios_info else {"Status": "BIOS information not accessible"}
 
-def check_system_health():
-    """Perform basic system health checks"""
-    health_status = {
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'uptime': str(datetime.now() - datetime.fromtimestamp(psutil.boot_time())),
-        'boot_time': datetime.fromtimestamp(psutil.boot_time()).strftime('%Y-%m-%d %H:%M:%S')
-    }
+def check_system_health(snapshot):
+    """Perform basic system health checks on an already collected SystemSnapshot
+    
+    Times are epoch seconds, uptime is in seconds and each warning is a
+    (kind, device, usage %) tuple where device is only set for disks.
+    """
+    warnings = []
     
     # Check CPU usage
-    cpu_usage = psutil.cpu_percent(interval=1)
-    if cpu_usage > 80:
-        health_status['cpu_warning'] = f"High CPU usage: {cpu_usage}%"
+    if snapshot.cpu_percent > CPU_WARN_PERCENT:
+        warnings.append(('cpu', None, snapshot.cpu_percent))
     
     # Check memory usage
-    memory = psutil.virtual_memory()
-    if memory.percent > 85:
-        health_status['memory_warning'] = f"High memory usage: {memory.percent}%"
+    if snapshot.ram_percent > MEMORY_WARN_PERCENT:
+        warnings.append(('memory', None, snapshot.ram_percent))
     
     # Check disk usage
-    for partition in psutil.disk_partitions():
-        try:
-            usage = psutil.disk_usage(partition.mountpoint)
-            usage_percent = (usage.used / usage.total) * 100
-            if usage_percent > 90:
-                health_status[f'disk_warning_{partition.device}'] = f"Low disk space: {usage_percent:.1f}% used"
-        except PermissionError:
-            continue
+    for device, usage in snapshot.disks.items():
+        if usage is not None and usage['percent'] > DISK_WARN_PERCENT:
+            warnings.append(('disk', device, usage['percent']))
     
+    return {
+        'timestamp': snapshot.scan_time,
+        'uptime': snapshot.scan_time - _BOOT_TIME,
+        'boot_time': _BOOT_TIME,
+        'warnings': warnings
+    }
+
+def format_health(health):
+    """Format check_system_health() results for display"""
+    health_status = {
+        'timestamp': datetime.fromtimestamp(health['timestamp']).strftime('%Y-%m-%d %H:%M:%S'),
+        'uptime': str(timedelta(seconds=health['uptime'])),
+        'boot_time': datetime.fromtimestamp(health['boot_time']).strftime('%Y-%m-%d %H:%M:%S')
+    }
+    for kind, device, percent in health['warnings']:
+        if kind == 'cpu':
+            health_status['cpu_warning'] = f"High CPU usage: {percent}%"
+        elif kind == 'memory':
+            health_status['memory_warning'] = f"High memory usage: {percent}%"
+        else:
+            health_status[f'disk_warning_{device}'] = f"Low disk space: {percent:.1f}% used"
     return health_status
 
-def main():
-    """Main function to gather and display all motherboard/system information"""
-    print("=" * 60)
-    print("MOTHERBOARD & SYSTEM STATUS CHECK")
-    print("=" * 60)
-    print(f"Scan Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+@dataclass(slots=True)
+class SystemSnapshot:
+    """Raw readings from one collection pass, formatted only when rendered
+    
+    Sizes are in bytes, frequencies in MHz and temperatures in °C; None
+    marks a reading the platform doesn't provide.
+    """
+    scan_time: float
+    system: dict
+    bios: dict
+    physical_cores: int
+    total_cores: int
+    max_freq: float | None
+    current_freq: float | None
+    cpu_percent: float
+    load_avg: float | None
+    ram_total: int
+    ram_available: int
+    ram_percent: float
+    swap_total: int
+    swap_percent: float
+    temperatures: dict | None
+    disks: dict
+    network: dict
+    health: dict | None = None
+
+# SystemSnapshot fields filled from read_cpu() and read_memory()
+CPU_FIELDS = ('physical_cores', 'total_cores', 'max_freq', 'current_freq', 'cpu_percent', 'load_avg')
+MEMORY_FIELDS = ('ram_total', 'ram_available', 'ram_percent', 'swap_total', 'swap_percent')
+
+def _fields(snapshot, names):
+    """Pull the named SystemSnapshot fields back out as a dict"""
+    return {name: getattr(snapshot, name) for name in names}
+
+def collect_raw(sample_window=CPU_SAMPLE_WINDOW):
+    """Run every collector and gather the raw readings into a SystemSnapshot"""
+    scan_time = time.time()
+    
+    # The collectors are independent and mostly wait on IO, so run them together
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {name: executor.submit(collector) for name, collector in (
+            ('system', get_system_info),
+            ('bios', get_bios_info),
+            ('memory', read_memory),
+            ('temperatures', read_temperatures),
+            ('disks', scan_disks),
+            ('network', get_network_info),
+        )}
+        # Let the primed CPU counter accumulate a short sample window
+        time.sleep(sample_window)
+        futures['cpu'] = executor.submit(read_cpu)
+    
+    snapshot = SystemSnapshot(
+        scan_time=scan_time,
+        system=futures['system'].result(),
+        bios=futures['bios'].result(),
+        **futures['cpu'].result(),
+        **futures['memory'].result(),
+        temperatures=futures['temperatures'].result(),
+        disks=futures['disks'].result(),
+        network=futures['network'].result()
+    )
+    snapshot.health = check_system_health(snapshot)
+    return snapshot
+
+# Report sections with a fixed set of keys, filled with str.format_map
+_SYSTEM_TMPL = (
+    "SYSTEM INFORMATION:\n"
+    "------------------------------\n"
+    "System: {System}\n"
+    "Node Name: {Node Name}\n"
+    "Release: {Release}\n"
+    "Version: {Version}\n"
+    "Machine: {Machine}\n"
+    "Processor: {Processor}\n"
+    "Architecture: {Architecture}\n"
+    "Python Version: {Python Version}\n"
+)
+
+_CPU_TMPL = (
+    "CPU STATUS:\n"
+    "------------------------------\n"
+    "Physical Cores: {Physical Cores}\n"
+    "Total Cores: {Total Cores}\n"
+    "Max Frequency: {Max Frequency}\n"
+    "Current Frequency: {Current Frequency}\n"
+    "CPU Usage: {CPU Usage}\n"
+    "Load Average (1min): {Load Average (1min)}\n"
+)
+
+_MEMORY_TMPL = (
+    "MEMORY STATUS:\n"
+    "------------------------------\n"
+    "Total RAM: {Total RAM}\n"
+    "Available RAM: {Available RAM}\n"
+    "RAM Usage: {RAM Usage}\n"
+    "Total Swap: {Total Swap}\n"
+    "Swap Usage: {Swap Usage}\n"
+)
+
+def render_human(snapshot):
+    """Format a SystemSnapshot as the human readable status report"""
+    system_info = snapshot.system
+    bios_info = snapshot.bios
+    cpu_info = format_cpu(_fields(snapshot, CPU_FIELDS))
+    memory_info = format_memory(_fields(snapshot, MEMORY_FIELDS))
+    temp_info = format_temperatures(snapshot.temperatures)
+    disk_info = format_disks(snapshot.disks)
+    network_info = snapshot.network
+    health = format_health(snapshot.health)
+    
+    # Build the whole report in memory so it can be written out in one call
+    out = io.StringIO()
+    emit = partial(print, file=out)
+    
+    emit("=" * 60)
+    emit("MOTHERBOARD & SYSTEM STATUS CHECK")
+    emit("=" * 60)
+    emit(f"Scan Time: {datetime.fromtimestamp(snapshot.scan_time).strftime('%Y-%m-%d %H:%M:%S')}")
+    emit()
     
     # System Information
-    print("SYSTEM INFORMATION:")
-    print("-" * 30)
-    system_info = get_system_info()
-    for key, value in system_info.items():
-        print(f"{key}: {value}")
-    print()
+    emit(_SYSTEM_TMPL.format_map(system_info))
     
     # BIOS Information
-    print("BIOS/MOTHERBOARD INFORMATION:")
-    print("-" * 30)
-    bios_info = get_bios_info()
+    emit("BIOS/MOTHERBOARD INFORMATION:")
+    emit("-" * 30)
     for key, value in bios_info.items():
-        print(f"{key}: {value}")
-    print()
+        emit(f"{key}: {value}")
+    emit()
     
     # CPU Information
-    print("CPU STATUS:")
-    print("-" * 30)
-    cpu_info = get_cpu_info()
-    for key, value in cpu_info.items():
-        print(f"{key}: {value}")
-    print()
+    emit(_CPU_TMPL.format_map(cpu_info))
     
     # Memory Information
-    print("MEMORY STATUS:")
-    print("-" * 30)
-    memory_info = get_memory_info()
-    for key, value in memory_info.items():
-        print(f"{key}: {value}")
-    print()
+    emit(_MEMORY_TMPL.format_map(memory_info))
     
     # Temperature Information
-    print("TEMPERATURE SENSORS:")
-    print("-" * 30)
-    temp_info = get_temperature_info()
+    emit("TEMPERATURE SENSORS:")
+    emit("-" * 30)
     if isinstance(temp_info, dict) and 'Status' in temp_info:
-        print(temp_info['Status'])
+        emit(temp_info['Status'])
     else:
         for sensor_name, readings in temp_info.items():
-            print(f"{sensor_name}:")
+            emit(f"{sensor_name}:")
             for reading in readings:
-                print(f"  {reading['label']}: {reading['current']} (High: {reading['high']}, Critical: {reading['critical']})")
-    print()
+                emit(f"  {reading['label']}: {reading['current']} (High: {reading['high']}, Critical: {reading['critical']})")
+    emit()
     
     # Disk Information
-    print("DISK STATUS:")
-    print("-" * 30)
-    disk_info = get_disk_info()
+    emit("DISK STATUS:")
+    emit("-" * 30)
     for device, info in disk_info.items():
-        print(f"{device}:")
+        emit(f"{device}:")
         for key, value in info.items():
-            print(f"  {key}: {value}")
-        print()
+            emit(f"  {key}: {value}")
+        emit()
     
     # Network Information
-    print("NETWORK INTERFACES:")
-    print("-" * 30)
-    network_info = get_network_info()
+    emit("NETWORK INTERFACES:")
+    emit("-" * 30)
     for interface, info in network_info.items():
-        print(f"{interface}:")
-        print(f"  Status: {'UP' if info['is_up'] else 'DOWN'}")
-        print(f"  Speed: {info['speed']}")
+        emit(f"{interface}:")
+        emit(f"  Status: {'UP' if info['is_up'] else 'DOWN'}")
+        emit(f"  Speed: {info['speed']} Mbps" if info['speed'] is not None else "  Speed: N/A")
         for addr in info['addresses'][:2]:  # Limit output
-            print(f"  {addr['family']}: {addr['address']}")
-        print()
+            emit(f"  {_FAMILY.get(addr['family'], 'OTHER')}: {addr['address']}")
+        emit()
     
     # Health Check
-    print("SYSTEM HEALTH CHECK:")
-    print("-" * 30)
-    health = check_system_health()
+    emit("SYSTEM HEALTH CHECK:")
+    emit("-" * 30)
     for key, value in health.items():
         if 'warning' in key.lower():
-            print(f"⚠️  {key.replace('_', ' ').title()}: {value}")
+            emit(f"⚠️  {key.replace('_', ' ').title()}: {value}")
         else:
-            print(f"{key.replace('_', ' ').title()}: {value}")
-    print()
+            emit(f"{key.replace('_', ' ').title()}: {value}")
+    emit()
+    
+    emit("=" * 60)
+    emit("SCAN COMPLETE")
+    emit("=" * 60)
+    
+    return out.getvalue()
+
+def render_json(snapshot):
+    """Format a SystemSnapshot as a single line of JSON"""
+    if orjson is not None:
+        return orjson.dumps(snapshot).decode() + "\n"
+    return json.dumps(asdict(snapshot), ensure_ascii=False, separators=(",", ":")) + "\n"
+
+def _sampler(interval, latest, ready, stop):
+    """Collect a snapshot every interval seconds until stop is set
+    
+    Each snapshot replaces the previous one in latest, a deque(maxlen=1),
+    and ready is set so the reader knows there is something new. If a
+    collection fails the exception is handed over the same way and the
+    sampler stops, so the reader can re-raise it.
+    """
+    # Only the first tick needs a window, later ones measure since the last tick
+    sample_window = CPU_SAMPLE_WINDOW
+    while not stop.is_set():
+        started = time.monotonic()
+        try:
+            latest.append(collect_raw(sample_window=sample_window))
+        except Exception as e:
+            latest.append(e)
+            ready.set()
+            return
+        sample_window = 0
+        ready.set()
+        stop.wait(max(0.0, interval - (time.monotonic() - started)))
+
+def poll(interval, as_json=False):
+    """Print a fresh snapshot every interval seconds until interrupted"""
+    render = render_json if as_json else render_human
+    latest = deque(maxlen=1)
+    ready = threading.Event()
+    stop = threading.Event()
+    sampler = threading.Thread(target=_sampler, args=(interval, latest, ready, stop), daemon=True)
+    sampler.start()
+    
+    try:
+        while True:
+            # Wait in short steps so Ctrl+C gets through on Windows too
+            if not ready.wait(0.5):
+                if not sampler.is_alive():
+                    raise RuntimeError("Sampler thread stopped unexpectedly")
+                continue
+            ready.clear()
+            # Take the snapshot out so a late set() can't print it twice
+            try:
+                snapshot = latest.pop()
+            except IndexError:
+                continue
+            if isinstance(snapshot, Exception):
+                raise snapshot
+            sys.stdout.write(render(snapshot))
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+
+def main(argv=None):
+    """Main function to gather and display all motherboard/system information"""
+    parser = argparse.ArgumentParser(description="Motherboard & system status check")
+    parser.add_argument('--poll', type=float, metavar='SECS',
+                        help="keep sampling every SECS seconds instead of running once")
+    parser.add_argument('--json', action='store_true',
+                        help="emit each snapshot as one line of JSON")
+    args = parser.parse_args(argv)
+    if args.poll is not None and not (math.isfinite(args.poll) and args.poll > 0):
+        parser.error("--poll must be a positive, finite number of seconds")
+    
+    if args.poll:
+        poll(args.poll, as_json=args.json)
+        return
     
-    print("=" * 60)
-    print("SCAN COMPLETE")
-    print("=" * 60)
+    render = render_json if args.json else render_human
+    sys.stdout.write(render(collect_raw()))
 
 if __name__ == "__main__":
     try: